@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import os
+import sys
 import textwrap
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,6 +12,13 @@ if TYPE_CHECKING:
 from .question import Question
 
 
+@lru_cache(maxsize=None)
+def _wrap(text: str, width: int) -> tuple[str, ...]:
+    """Zapamiętane textwrap.wrap – to samo pytanie łamiemy raz,
+    a ekran ask/notify_result pokazuje je dwukrotnie."""
+    return tuple(textwrap.wrap(text, width=width))
+
+
 class BaseInterface(ABC):
     """Abstrakcyjna warstwa prezentacji (CLI, GUI, itp.)."""
 
@@ -41,25 +50,28 @@ class CliInterface(BaseInterface):
     """Prosta implementacja linii komend."""
 
     WIDTH = 80  # szerokość ramki z '#'
+    BORDER = "#" * WIDTH
 
     @staticmethod
     def _clear() -> None:
-        os.system("cls" if os.name == "nt" else "clear")
+        if os.name == "nt":
+            os.system("cls")
+        else:
+            # Bez fork+exec powłoki na każdy ekran – sam kod ANSI wystarczy.
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
 
     @classmethod
     def _line(cls, text: str = "") -> str:
         return f" {text}"
 
-    def _print_wrapped(self, prefix: str, text: str) -> None:
-        """Print text wrapped to WIDTH, keeping the prefix on the first line."""
-        lines = textwrap.wrap(text, width=self.WIDTH - len(prefix))
+    def _wrapped_lines(self, prefix: str, text: str) -> list[str]:
+        """Wrap text to WIDTH, keeping the prefix on the first line."""
+        lines = _wrap(text, self.WIDTH - len(prefix))
         if not lines:
-            print(prefix.rstrip())
-            return
-        print(prefix + lines[0])
+            return [prefix.rstrip()]
         indent = " " * len(prefix)
-        for l in lines[1:]:
-            print(indent + l)
+        return [prefix + lines[0]] + [indent + l for l in lines[1:]]
 
     def _global_stats_line(self) -> str:
         correct_cnt = self.quiz.total_unique_correct()
@@ -70,30 +82,24 @@ class CliInterface(BaseInterface):
         self._clear()
         question.display_image()
 
-        border = "#" * self.WIDTH
-        header = self._line(f"Question {idx} of {total}: {question.file.name}")
+        border = self.BORDER
+        header = self._line(f"Question {idx} of {total}: {question.name}")
         stats_line = self._global_stats_line()
 
-        print(border)
-        print(header)
-        print(stats_line)
-        print(border)
-        print()
-        self._print_wrapped("Q: ", question.question)
-        print()
+        # Jeden write na cały ekran zamiast kilkunastu print().
+        buf = [border, header, stats_line, border, ""]
+        buf += self._wrapped_lines("Q: ", question.question)
+        buf.append("")
         for idx_ans, ans in enumerate(question.available_answers, start=1):
-            self._print_wrapped(f"{idx_ans}. ", ans)
-        print()
+            buf += self._wrapped_lines(f"{idx_ans}. ", ans)
+        buf.append("")
 
-        print(border)
         prompt_text = "Enter your answer: "
-        prompt_line = self._line(prompt_text)
-        print(prompt_line)
-        print(border)
+        buf += [border, self._line(prompt_text), border]
 
-        print("\033[2A", end="")
         cursor_col = 2 + len(prompt_text)
-        print(f"\033[{cursor_col}C", end="", flush=True)
+        sys.stdout.write("\n".join(buf) + "\n" + f"\033[2A\033[{cursor_col}C")
+        sys.stdout.flush()
 
         answer = input().strip()
         print()
@@ -102,36 +108,31 @@ class CliInterface(BaseInterface):
     def notify_result(self, question: Question, correct: bool, idx: int, total: int, user_answer: str) -> None:
         self._clear()
 
-        border = "#" * self.WIDTH
+        border = self.BORDER
         symbol = "✅  " if correct else "❌  "
-        header = self._line(f"Question {idx} of {total}: {question.file.name} {symbol} ")
+        header = self._line(f"Question {idx} of {total}: {question.name} {symbol} ")
         stats_line = self._global_stats_line()
 
-        print(border)
-        print(header)
-        print(stats_line)
-        print(border)
-        print()
-
-        self._print_wrapped("Q: ", question.question)
-        print()
+        buf = [border, header, stats_line, border, ""]
+        buf += self._wrapped_lines("Q: ", question.question)
+        buf.append("")
+        correct_set = question.correct_set()
         for idx_ans, ans in enumerate(question.available_answers, start=1):
-            mark = "✅  " if idx_ans in question.correct_indices() else "❌  "
-            self._print_wrapped(f"{mark}{idx_ans}. ", ans)
-        print()
+            mark = "✅  " if idx_ans in correct_set else "❌  "
+            buf += self._wrapped_lines(f"{mark}{idx_ans}. ", ans)
+        buf.append("")
 
-        print(border)
         prompt_line = self._line(f"Your answer: {', '.join(map(str, Question.parse_user_input(user_answer)))} {correct and '✅' or '❌'}")
-        print(prompt_line)
-        print(border)
-        print()
+        buf += [border, prompt_line, border, ""]
+        sys.stdout.write("\n".join(buf) + "\n")
+        sys.stdout.flush()
 
     def pause(self) -> None:
         input("Press enter to continue")
         self._clear()
 
     def show_summary(self) -> None:
-        border = "#" * self.WIDTH
+        border = self.BORDER
         total_q = len(self.quiz.questions)
         correct_q = self.quiz.total_unique_correct()
         incorrect_q = self.quiz.total_unique_incorrect()
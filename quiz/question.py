@@ -1,13 +1,46 @@
 import os
 import platform
+import re
 import subprocess
 from pathlib import Path
 from typing import Union
 
+_UNSET = object()
+
+# Pojedyncze cyfry, nie liczby – "13" oznacza odpowiedzi 1 i 3.
+_DIGIT_RE = re.compile(r"\d")
+
+# System nie zmienia się w trakcie działania – przeglądarkę obrazków
+# wybieramy raz, przy imporcie.
+_SYSTEM = platform.system()
+if _SYSTEM == "Darwin":
+    def _open_image(path: Path) -> None:
+        subprocess.Popen(["open", str(path.absolute())])
+elif _SYSTEM == "Windows":
+    def _open_image(path: Path) -> None:
+        os.startfile(str(path))
+else:
+    def _open_image(path: Path) -> None:
+        subprocess.Popen(["xdg-open", str(path.absolute())])
+
 
 class Question:
     IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif')
 
+    # Pytania powstają hurtowo (jedno na plik) – bez __dict__ instancja
+    # jest mniejsza, a dostęp do atrybutów szybszy.
+    __slots__ = (
+        "file",
+        "name",
+        "question",
+        "correct_answers",
+        "available_answers",
+        "_correct_indices",
+        "_correct_set",
+        "_image_path",
+        "_numbered_answers",
+    )
+
     def __init__(
             self,
             file: Path,
@@ -16,18 +49,30 @@ class Question:
             available_answers: list[str],
     ):
         self.file = file
+        # Path.name parsuje ścieżkę przy każdym odczycie – klucz statystyk
+        # trzymamy jako zwykły string.
+        self.name = file.name
         self.question = question
         self.correct_answers = correct_answers
         self.available_answers = available_answers
+        self._correct_indices = [i + 1 for i, c in enumerate(correct_answers) if c == "1"]
+        self._correct_set = frozenset(self._correct_indices)
+        self._image_path = _UNSET
+        self._numbered_answers = [
+            f"{i + 1}. {answer}" for i, answer in enumerate(available_answers)
+        ]
 
     def __str__(self):
-        return f'Question [{self.file.name}]: {self.question}?\n' + '\n'.join(f'{i + 1}. {answer}' for i, answer in enumerate(self.available_answers))
+        return f'Question [{self.name}]: {self.question}?\n' + '\n'.join(self._numbered_answers)
 
     def correct_indices(self) -> list[int]:
-        return [i + 1 for i, c in enumerate(self.correct_answers) if c == "1"]
+        return self._correct_indices
+
+    def correct_set(self) -> frozenset[int]:
+        return self._correct_set
 
     def answers_ok(self, user_input: str) -> bool:
-        return Question.parse_user_input(user_input) == set(self.correct_indices())
+        return Question.parse_user_input(user_input) == self._correct_set
 
     @staticmethod
     def parse_user_input(user_input: str) -> set[int]:
@@ -35,7 +80,7 @@ class Question:
         Parses user input and returns a list of integers representing the selected answers.
         Accepts answers like '2 4 5', '245', or any mix of whitespace and digits.
         """
-        return set([int(ch) for ch in user_input if ch.isdigit()])
+        return {int(ch) for ch in _DIGIT_RE.findall(user_input)}
 
     def answers_as_str(self) -> str:
         return ", ".join(map(str, self.correct_indices()))
@@ -48,48 +93,94 @@ class Question:
     def from_file(cls, file: Path) -> "Question":
         if not cls.should_process(file):
             raise ValueError(f"File {file} is not a valid question file")
-        if not file.exists():
-            raise FileNotFoundError(f"File {file} does not exist")
 
         def is_img_tag(line: str) -> bool:
-            line = line.strip()
-            return line.lower().startswith("[img]") and line.lower().endswith("[/img]")
-
-        with open(file, "r", encoding="utf-8", errors="replace") as f:  # protects against UnicodeDecodeError
-            correct_answers = f.readline().strip("X\n")
-            question = f.readline().rstrip(" ?\n")
-            available_answers = [
-                x.strip() for x in f.readlines()
-                if x.strip() and not is_img_tag(x)
-            ]
+            line = line.strip().lower()
+            return line.startswith("[img]") and line.endswith("[/img]")
+
+        # errors="replace" protects against UnicodeDecodeError
+        text = file.read_text(encoding="utf-8", errors="replace")
+        lines = text.split("\n")
+        correct_answers = lines[0].strip("X") if lines else ""
+        question = lines[1].rstrip(" ?") if len(lines) > 1 else ""
+        available_answers = [
+            x.strip() for x in lines[2:]
+            if x.strip() and not is_img_tag(x)
+        ]
 
         return cls(file, question, correct_answers, available_answers)
 
     def image_path(self) -> Union[Path, None]:
-        """Zwraca ścieżkę do pierwszego istniejącego pliku graficznego lub None."""
-        for ext in self.IMAGE_EXTENSIONS:
-            candidate = self.file.with_suffix(ext)
-            if candidate.exists():
-                return candidate
+        """Zwraca ścieżkę do pierwszego istniejącego pliku graficznego lub None.
 
-        return None
+        Wynik (również None) jest zapamiętywany – katalog czytamy raz,
+        zamiast wykonywać stat() dla każdego rozszerzenia przy każdym pytaniu.
+        """
+        if self._image_path is _UNSET:
+            self._image_path = self._resolve_image_path()
+        return self._image_path
+
+    def _resolve_image_path(self) -> Union[Path, None]:
+        try:
+            with os.scandir(self.file.parent) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            return None
+
+        return _find_image(self.file, names)
+
+    def prime_image_path(self, sibling_names: set[str]) -> None:
+        """Ustawia ścieżkę obrazka na podstawie gotowej listy plików katalogu."""
+        self._image_path = _find_image(self.file, sibling_names)
 
     def has_image(self) -> bool:
         return self.image_path() is not None
 
     def display_image(self):
         path = self.image_path()
-        if not path:
-            return
-
-        system = platform.system()
-        if system == "Darwin":
-            subprocess.Popen(["open", str(path.absolute())])
-        elif system == "Windows":
-            os.startfile(str(path))
-        else:
-            subprocess.Popen(["xdg-open", str(path.absolute())])
+        if path:
+            _open_image(path)
 
     @staticmethod
     def should_process(file: Path) -> bool:
         return file.name.endswith('.txt')
+
+
+def _find_image(file: Path, names: set[str]) -> Union[Path, None]:
+    stem = file.stem
+    for ext in Question.IMAGE_EXTENSIONS:
+        candidate = stem + ext
+        if candidate in names:
+            return file.with_name(candidate)
+
+    return None
+
+
+class LazyQuestion:
+    """Pytanie ładowane leniwie – plik czytamy dopiero przy pierwszym
+    użyciu treści, więc pytania pomijane nie kosztują żadnego odczytu."""
+
+    __slots__ = ("file", "name", "_question", "_primed_image")
+
+    def __init__(self, file: Path):
+        self.file = file
+        self.name = file.name
+        self._question: Union[Question, None] = None
+        self._primed_image = _UNSET
+
+    def prime_image_path(self, sibling_names: set[str]) -> None:
+        self._primed_image = _find_image(self.file, sibling_names)
+
+    def _load(self) -> Question:
+        if self._question is None:
+            question = Question.from_file(self.file)
+            if self._primed_image is not _UNSET:
+                question._image_path = self._primed_image
+            self._question = question
+        return self._question
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __str__(self):
+        return str(self._load())
@@ -1,12 +1,23 @@
+import atexit
 import json
+import os
 from pathlib import Path
 from typing import Union
 
+try:
+    import orjson  # opcjonalne – znacznie szybsza serializacja JSON
+except ImportError:
+    orjson = None
+
 from .interface import BaseInterface, CliInterface
-from .question import Question
+from .question import LazyQuestion, Question
 
 
 class Quiz:
+    # Zapis co tyle odpowiedzi; resztę dopisuje flush na końcu rundy
+    # oraz atexit.
+    SAVE_EVERY = 10
+
     def __init__(
             self,
             questions: list[Question],
@@ -18,21 +29,33 @@ class Quiz:
         self.questions = questions
         self.progress_path = progress_path
         self.should_update_progress = should_update_progress
-        self.correct_questions: list[str] = []
-        self.incorrect_questions: list[str] = []
         self.stats: dict[str, dict[str, int]] = {}
+        self._dirty = False
+        self._parent_ready = False
         self._load_progress()
+        # Kept in sync by _record_result so the per-screen stats line does
+        # not re-scan the whole stats dict.
+        self._n_correct = sum(1 for v in self.stats.values() if v["correct"] > 0)
+        self._n_incorrect_only = sum(
+            1 for v in self.stats.values() if v["correct"] == 0 and v["incorrect"] > 0
+        )
+        self._solved = {n for n, v in self.stats.items() if v["correct"] > 0}
         self.interface = interface or CliInterface(self)
         self.skip_solved = skip_solved
+        self._answers_since_save = 0
+        if should_update_progress:
+            atexit.register(self._flush_progress)
 
     def _load_progress(self):
         if not self.progress_path.exists():
             return
 
         try:
-            with open(self.progress_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            raw = self.progress_path.read_bytes()
+            # orjson dekoduje kilkukrotnie szybciej; ValueError obejmuje
+            # błędy dekodowania obu bibliotek.
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
             return
 
         if isinstance(data.get("stats"), dict):
@@ -42,23 +65,43 @@ class Quiz:
             }
             return
 
-        self.correct_questions = data.get("correct", [])
-        self.incorrect_questions = data.get("incorrect", [])
-        for name in self.correct_questions:
+        # Stary format pliku – listy służą tylko do odtworzenia statystyk.
+        for name in data.get("correct", []):
             self.stats.setdefault(name, {"correct": 0, "incorrect": 0})["correct"] += 1
-        for name in self.incorrect_questions:
+        for name in data.get("incorrect", []):
             self.stats.setdefault(name, {"correct": 0, "incorrect": 0})["incorrect"] += 1
 
-    def _save_progress(self):
-        self.progress_path.parent.mkdir(parents=True, exist_ok=True)
+        # Jednorazowa migracja: zapisany plik ma już sekcję "stats",
+        # więc każdy kolejny start trafia w szybką ścieżkę powyżej.
+        if self.should_update_progress:
+            try:
+                self._save_progress()
+            except OSError:
+                pass
 
-        with open(self.progress_path, "w", encoding="utf-8") as f:
-            data = {
-                "stats": self.stats,
-                "correct": self.correct_questions,
-                "incorrect": self.incorrect_questions,
-            }
-            json.dump(data, f, indent=2)
+    def _save_progress(self):
+        if not self._parent_ready:
+            self.progress_path.parent.mkdir(parents=True, exist_ok=True)
+            self._parent_ready = True
+
+        # Zapisujemy wyłącznie "stats" – listy correct/incorrect dałyby się
+        # z nich wyprowadzić, więc tylko podwajałyby rozmiar pliku.
+        # _load_progress nadal czyta stare pliki z listami.
+        data = {"stats": self.stats}
+        # Serialize to bytes first: json.dump issues one small write per
+        # token, while a pre-built payload goes out in a single write.
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        # Zapis przez plik tymczasowy + os.replace – przerwany zapis nigdy
+        # nie zostawia uciętego progress.json.
+        tmp_path = self.progress_path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.progress_path)
+        self._dirty = False
+        self._answers_since_save = 0
 
     @classmethod
     def from_directory(
@@ -73,59 +116,105 @@ class Quiz:
         if not directory.exists():
             raise FileNotFoundError(directory)
 
-        question_paths = sorted(
-            p for p in directory.rglob("*") if Question.should_process(p)
-        )
-        questions = [Question.from_file(p) for p in question_paths]
+        # os.walk podaje gotowe nazwy plików – filtrujemy i sortujemy
+        # zwykłe stringi, bez tworzenia obiektów Path dla odrzuconych wpisów.
+        question_paths = [
+            Path(p) for p in sorted(
+                os.path.join(dirpath, name)
+                for dirpath, _dirnames, filenames in os.walk(directory)
+                for name in filenames
+                if name.endswith(".txt")
+            )
+        ]
+        # Leniwe wczytywanie: plik pytania czytamy dopiero gdy run()
+        # faktycznie go potrzebuje, więc pominięte pytania nic nie kosztują.
+        questions = [LazyQuestion(p) for p in question_paths]
+        cls._prime_image_paths(questions)
         progress_path = progress_path or directory / "progress.json"
         return cls(questions, progress_path, should_update_progress, interface, skip_solved=skip_solved)
 
-    def _should_skip(self, question: Question) -> bool:
-        return (
-                self.skip_solved
-                and self.stats.get(question.file.name, {}).get("correct", 0) > 0
-        )
+    @staticmethod
+    def _prime_image_paths(questions: list[Union[Question, LazyQuestion]]) -> None:
+        """Rozwiązuje ścieżki obrazków jednym scandir na katalog,
+        zamiast osobnych sond przy każdym wyświetleniu pytania."""
+        names_by_dir: dict[Path, set[str]] = {}
+        for question in questions:
+            parent = question.file.parent
+            names = names_by_dir.get(parent)
+            if names is None:
+                try:
+                    with os.scandir(parent) as it:
+                        names = {entry.name for entry in it}
+                except OSError:
+                    names = set()
+                names_by_dir[parent] = names
+            question.prime_image_path(names)
 
     def _record_result(self, name: str, correct: bool) -> None:
-        self.stats.setdefault(name, {"correct": 0, "incorrect": 0})
-        key_add, key_remove = ("correct", "incorrect") if correct else ("incorrect", "correct")
-        self.stats[name][key_add] += 1
+        entry = self.stats.setdefault(name, {"correct": 0, "incorrect": 0})
+        was_correct = entry["correct"] > 0
+        was_incorrect_only = not was_correct and entry["incorrect"] > 0
+        entry["correct" if correct else "incorrect"] += 1
 
-        add_list = self.correct_questions if correct else self.incorrect_questions
-        rem_list = self.incorrect_questions if correct else self.correct_questions
+        if correct and not was_correct:
+            self._n_correct += 1
+            self._solved.add(name)
+            if was_incorrect_only:
+                self._n_incorrect_only -= 1
+        elif not correct and not was_correct and not was_incorrect_only:
+            self._n_incorrect_only += 1
 
-        if name not in add_list:
-            add_list.append(name)
-        rem_list[:] = [q for q in rem_list if q != name]
+        self._dirty = True
 
     def _maybe_save_progress(self) -> None:
-        if self.should_update_progress:
+        if not (self.should_update_progress and self._dirty):
+            return
+        # Pełny zapis po każdym pytaniu jest zbędny – wystarczy co kilka
+        # odpowiedzi, a resztę domyka _flush_progress.
+        self._answers_since_save += 1
+        if self._answers_since_save >= self.SAVE_EVERY:
+            self._save_progress()
+
+    def _flush_progress(self) -> None:
+        if not (self.should_update_progress and self._dirty):
+            return
+        try:
             self._save_progress()
+        except OSError:
+            # np. katalog docelowy już nie istnieje przy wyjściu z programu
+            pass
 
     def _get_question_stats(self, q: Question) -> dict[str, int]:
-        return self.stats.get(q.file.name, {"correct": 0, "incorrect": 0})
+        return self.stats.get(q.name, {"correct": 0, "incorrect": 0})
 
     def _process_single(self, question: Question, idx: int, total: int):
-        user_ans = self.interface.ask(question, idx, total)
+        interface = self.interface
+        user_ans = interface.ask(question, idx, total)
         correct = question.answers_ok(user_ans)
-        self._record_result(question.file.name, correct)
-        self.interface.notify_result(question, correct, idx, total, user_ans)
+        self._record_result(question.name, correct)
+        interface.notify_result(question, correct, idx, total, user_ans)
         self._maybe_save_progress()
-        self.interface.pause()
+        interface.pause()
 
     def run(self):
-        total = len(self.questions)
-        for idx, q in enumerate(self.questions, start=1):
-            if self._should_skip(q):
+        questions = self.questions
+        total = len(questions)
+        # Kopia na start rundy – pytania rozwiązane w jej trakcie nie mają
+        # wpływać na dalsze pomijanie.
+        solved = set(self._solved) if self.skip_solved else set()
+        process = self._process_single
+        for idx, q in enumerate(questions, start=1):
+            if q.name in solved:
                 continue
-            self._process_single(q, idx, total)
+            process(q, idx, total)
+        self._flush_progress()
         self.interface.show_summary()
 
     def total_unique_correct(self) -> int:
-        return sum(1 for v in self.stats.values() if v["correct"] > 0)
+        return self._n_correct
 
     def total_unique_incorrect(self) -> int:
-        return sum(1 for v in self.stats.values() if v["correct"] == 0 and v["incorrect"] > 0)
+        return self._n_incorrect_only
 
     def ratio(self) -> float:
         total = len(self.questions)
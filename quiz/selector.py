@@ -2,8 +2,6 @@ import os
 import sys
 from pathlib import Path
 
-from .question import Question
-
 if os.name == "nt":
     import msvcrt
 else:
@@ -28,44 +26,65 @@ def _arrow_select(options: list[str]) -> int:
             print("Niepoprawny wybór – spróbuj ponownie.")
 
     sel = 0
+    n = len(options)
+
+    def _repaint_line(i: int) -> str:
+        """Sekwencja ANSI przerysowująca pojedynczą linię listy.
+        Kursor stoi pod listą, więc linia i jest n-i wierszy wyżej."""
+        up = n - i
+        prefix = "👉 " if i == sel else "   "
+        return f"\x1b[{up}A\r\x1b[2K{prefix}{options[i]}\x1b[{up}B\r"
+
+    def _render_all() -> None:
+        if os.name == "nt":
+            os.system("cls")
+        else:
+            sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.write("".join(
+            f"{'👉 ' if i == sel else '   '}{text}\n" for i, text in enumerate(options)
+        ))
+        sys.stdout.flush()
 
-    def _clear():
-        os.system("cls" if os.name == "nt" else "clear")
+    def _move_to(new: int) -> None:
+        """Przerysowuje tylko dwie zmienione linie zamiast całego ekranu."""
+        nonlocal sel
+        old_sel, sel = sel, new
+        if old_sel == new:
+            return
+        sys.stdout.write(_repaint_line(old_sel) + _repaint_line(new))
+        sys.stdout.flush()
 
-    def _render() -> None:
-        _clear()
-        for i, text in enumerate(options):
-            prefix = "👉 " if i == sel else "   "
-            print(f"{prefix}{text}")
+    _render_all()
 
     if os.name == "nt":  # Windows – msvcrt
         while True:
-            _render()
             key = msvcrt.getch()
             if key == b'\r':  # Enter
                 return sel
             if key == b'\xe0':  # kod rozszerzony
                 direction = msvcrt.getch()
                 if direction == b'H':  # strzałka ↑
-                    sel = (sel - 1) % len(options)
+                    _move_to((sel - 1) % n)
                 elif direction == b'P':  # strzałka ↓
-                    sel = (sel + 1) % len(options)
+                    _move_to((sel + 1) % n)
     else:  # Unix-like – termios/tty
         fd = sys.stdin.fileno()
         old = termios.tcgetattr(fd)
         try:
             tty.setcbreak(fd)
             while True:
-                _render()
-                ch = sys.stdin.read(1)
-                if ch == '\n' or ch == '\r':  # Enter
+                # Cała sekwencja strzałki (ESC [ A/B) w jednym read(),
+                # zamiast trzech przejść przez buforowane stdin.
+                buf = os.read(fd, 3)
+                if buf in (b'\n', b'\r'):  # Enter
                     return sel
-                if ch == '\x1b':  # sekwencja ESC
-                    seq = sys.stdin.read(2)
-                    if seq == '[A':  # ↑
-                        sel = (sel - 1) % len(options)
-                    elif seq == '[B':  # ↓
-                        sel = (sel + 1) % len(options)
+                if buf.startswith(b'\x1b'):  # sekwencja ESC
+                    while len(buf) < 3:  # dociągnij, gdyby przyszła partiami
+                        buf += os.read(fd, 3 - len(buf))
+                    if buf == b'\x1b[A':  # ↑
+                        _move_to((sel - 1) % n)
+                    elif buf == b'\x1b[B':  # ↓
+                        _move_to((sel + 1) % n)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old)
 
@@ -73,16 +92,21 @@ def _arrow_select(options: list[str]) -> int:
 def _collect_quiz_dirs(base: Path) -> list[Path]:
     """Zwraca katalogi zawierające pliki .txt (pytania) lub progress.json.
        Te z plikiem progress.json są sortowane wyżej."""
-    dirs: list[Path] = []
-    for p in base.rglob("*"):
-        if not p.is_dir():
+    dirs: list[tuple[Path, bool]] = []
+    base_path = os.fspath(base)
+    # Jeden przebieg os.walk zamiast rglob + iterdir: listy nazw plików
+    # dostajemy gotowe, bez dodatkowych syscalli na katalog.
+    for dirpath, _dirnames, filenames in os.walk(base):
+        if dirpath == base_path:
             continue
-        has_txt = any(Question.should_process(f) for f in p.iterdir())
-        has_progress = (p / "progress.json").exists()
+        has_txt = any(name.endswith(".txt") for name in filenames)
+        has_progress = "progress.json" in filenames
         if has_txt or has_progress:
-            dirs.append(p)
-    dirs.sort(key=lambda d: (0 if (d / "progress.json").exists() else 1, str(d).lower()))
-    return dirs
+            dirs.append((Path(dirpath), has_progress))
+    # Flagę progress.json znamy już z przebiegu – klucz sortowania nie
+    # wykonuje żadnych stat().
+    dirs.sort(key=lambda t: (0 if t[1] else 1, os.fspath(t[0]).casefold()))
+    return [d for d, _ in dirs]
 
 
 def _select_directory(dirs: list[Path], base: Path) -> Path:
@@ -78,3 +78,22 @@ def test_quiz_flow_and_stats(tmp_path):
     qi._save_progress()
     data = json.loads((tmp_path / "progress.json").read_text(encoding="utf-8"))
     assert set(data["stats"].keys()) == {"q1.txt", "q2.txt"}
+
+
+def test_solved_questions_are_never_opened(tmp_path):
+    _make_qfile(tmp_path, "q1", mask="10")
+    _make_qfile(tmp_path, "q2", mask="01")
+    progress = {"stats": {"q1.txt": {"correct": 1, "incorrect": 0}}}
+    (tmp_path / "progress.json").write_text(json.dumps(progress), encoding="utf-8")
+
+    qi = Quiz.from_directory(
+        tmp_path,
+        interface=DummyInterface(None, ["2"]),
+        should_update_progress=False,
+    )
+    qi.interface.quiz = qi
+    # rozwiązany plik znika z dysku – pominięcie nie może go otwierać
+    (tmp_path / "q1.txt").unlink()
+    qi.run()
+
+    assert qi.total_unique_correct() == 2
@@ -18,3 +18,12 @@ def test_quiz_end_to_end(workdir):
     assert quiz.total_unique_correct() == 2
     assert quiz.total_unique_incorrect() == 0
     assert quiz.ratio() == 1.0
+
+
+def test_from_directory_does_not_parse_files_eagerly(workdir):
+    quiz = Quiz.from_directory(workdir, should_update_progress=False)
+
+    # pliki pytań czytamy dopiero przy pierwszym użyciu treści
+    assert all(q._question is None for q in quiz.questions)
+    assert quiz.questions[0].available_answers  # wymusza wczytanie
+    assert quiz.questions[0]._question is not None